@@ -1,26 +1,27 @@
 """The Breathe Audio Elevate 6.6 integration."""
 
 import asyncio
-from datetime import timedelta
 import logging
-from typing import Any, Callable, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, Platform
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .breathe_audio import BreatheAudioAPI
 from .const import (
-    CONF_POLLING_INTERVAL,
     CONF_SERIAL_PORT,
     CONF_ZONES,
     DEFAULT_NAME,
-    DEFAULT_POLLING_INTERVAL,
     DEFAULT_ZONES,
     DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    SCAN_INTERVAL,
+    VERIFY_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,14 +32,8 @@ PLATFORMS: List[Platform] = [Platform.MEDIA_PLAYER]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Breathe Audio from a config entry."""
     serial_port = entry.data[CONF_SERIAL_PORT]
-    zones = entry.options.get(
-        CONF_ZONES, entry.data.get(CONF_ZONES, DEFAULT_ZONES)
-    )
+    zones = _configured_zones(entry)
     name = entry.data.get(CONF_NAME, DEFAULT_NAME)
-    polling_interval = entry.options.get(
-        CONF_POLLING_INTERVAL,
-        entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL),
-    )
 
     # Create API instance
     api = BreatheAudioAPI(serial_port)
@@ -49,27 +44,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"Failed to connect to {serial_port}")
 
     # Create coordinator/data manager
-    coordinator = BreatheAudioData(hass, api, entry, zones, polling_interval)
+    coordinator = BreatheAudioData(hass, api, entry, zones)
+
+    # Start state subscriptions + initial refresh. HA does not unload an
+    # entry whose setup failed, so release the serial port here on failure.
+    try:
+        await coordinator.async_start()
+    except Exception:
+        await coordinator.async_stop()
+        await api.disconnect()
+        raise
 
     # Store in hass data
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "serial_port": serial_port,
         "zones": zones,
         "name": name,
     }
 
-    # Start state subscriptions + initial refresh
-    await coordinator.async_start()
-
     # Register device
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
         identifiers={(DOMAIN, serial_port)},
         name=name,
-        manufacturer="Breathe Audio",
-        model="Elevate 6.6 (BA-6640)",
+        manufacturer=MANUFACTURER,
+        model=MODEL,
         sw_version="1.0.0",
     )
 
@@ -97,12 +99,32 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options change."""
+    """Reload config entry when the serial port or zone count changes."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    if (
+        entry.data[CONF_SERIAL_PORT] == data["serial_port"]
+        and _configured_zones(entry) == data["zones"]
+    ):
+        _LOGGER.debug("Entry update does not affect the connection; skipping reload")
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-class BreatheAudioData:
-    """Manages state updates for Breathe Audio."""
+def _configured_zones(entry: ConfigEntry) -> int:
+    """Return the zone count, preferring the options flow value."""
+    return entry.options.get(CONF_ZONES, entry.data.get(CONF_ZONES, DEFAULT_ZONES))
+
+
+class BreatheAudioData(DataUpdateCoordinator[List[Dict[str, Any]]]):
+    """Coordinates polling and push updates for Breathe Audio.
+
+    ``data`` holds one state dict per zone, indexed by zone - 1. Every
+    parsed frame from the serial connection, including the replies to the
+    periodic status poll, is merged in place through the push path and
+    fanned out to listeners once per serial read. The poll then notifies
+    listeners as usual; entities skip the write when their zone is
+    unchanged.
+    """
 
     def __init__(
         self,
@@ -110,114 +132,140 @@ class BreatheAudioData:
         api: BreatheAudioAPI,
         entry: ConfigEntry,
         zones: int,
-        polling_interval: int = DEFAULT_POLLING_INTERVAL,
     ) -> None:
-        """Initialize the data manager."""
-        self.hass = hass
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+        )
         self.api = api
         self.entry = entry
         self.zones = zones
-        self._polling_interval = polling_interval
-        self._zone_data: Dict[int, Dict[str, Any]] = {}
-        self._listeners: Dict[int, List[Callable[[], None]]] = {}
+        self._zone_ids = tuple(range(1, zones + 1))
+        self.data = [{} for _ in range(zones)]
         self._available = api.connected
-        self._polling_unsub: CALLBACK_TYPE | None = None
+        self._push_changed = False
+        self._verify_zones: Set[int] = set()
+        self._verify_handle: Optional[asyncio.TimerHandle] = None
 
     @property
-    def zone_data(self) -> Dict[int, Dict[str, Any]]:
-        """Return cached zone data."""
-        return self._zone_data
+    def zone_data(self) -> List[Dict[str, Any]]:
+        """Return cached zone data, indexed by zone - 1."""
+        return self.data
 
     def get_zone_state(self, zone: int) -> Dict[str, Any]:
         """Get state for a specific zone."""
-        return self._zone_data.get(zone, {})
+        return self.data[zone - 1]
 
     @property
     def available(self) -> bool:
-        """Return connection availability."""
+        """Return True if the serial connection is up."""
         return self._available
 
-    def register_listener(self, zone: int, callback_fn: Callable[[], None]) -> None:
-        """Register a state update listener for a zone."""
-        if zone not in self._listeners:
-            self._listeners[zone] = []
-        self._listeners[zone].append(callback_fn)
+    def _merge_zone_state(self, zone: int, state: Dict[str, Any]) -> bool:
+        """Merge a state update into the cache; return True if anything changed."""
+        current = self.data[zone - 1]
+        changed = {
+            key: value for key, value in state.items() if current.get(key) != value
+        }
+        if not changed:
+            return False
+        current.update(changed)
+        return True
 
-    def unregister_listener(self, zone: int, callback_fn: Callable[[], None]) -> None:
-        """Unregister a state update listener."""
-        if zone in self._listeners and callback_fn in self._listeners[zone]:
-            self._listeners[zone].remove(callback_fn)
+    @callback
+    def _handle_zone_update(self, zone: int, state: Dict[str, Any]) -> None:
+        """Handle a zone state update, notifying listeners if it changed."""
+        if self._merge_zone_state(zone, state):
+            self.async_update_listeners()
 
     @callback
-    def _notify_listeners(self, zone: int) -> None:
-        """Notify listeners of state update."""
-        if zone in self._listeners:
-            for callback_fn in self._listeners[zone]:
-                callback_fn()
+    def _handle_pushed_update(self, zone: int, state: Dict[str, Any]) -> None:
+        """Merge a pushed zone update; listeners are notified per batch."""
+        if self._merge_zone_state(zone, state):
+            self._push_changed = True
 
-    def _handle_zone_update(self, zone: int, state: Dict[str, Any]) -> None:
-        """Handle async zone state update."""
-        if zone not in self._zone_data:
-            self._zone_data[zone] = {}
-        self._zone_data[zone].update(state)
-        self.hass.add_job(self._notify_listeners, zone)
+    @callback
+    def _handle_push_batch(self) -> None:
+        """Notify listeners once for all updates received in one read."""
+        if self._push_changed:
+            self._push_changed = False
+            self.async_update_listeners()
 
+    @callback
     def _handle_connection_update(self, available: bool) -> None:
         """Handle connection availability change."""
+        if available == self._available:
+            return
         self._available = available
-        for zone in range(1, self.zones + 1):
-            self.hass.add_job(self._notify_listeners, zone)
+        self.async_update_listeners()
 
     async def async_start(self) -> None:
-        """Start subscriptions, initial refresh, and periodic polling."""
+        """Start subscriptions and perform the initial refresh."""
         # Register callbacks for async feedback
-        for zone in range(1, self.zones + 1):
-            self.api.register_state_callback(
-                zone, lambda state, z=zone: self._handle_zone_update(z, state)
-            )
+        for zone in self._zone_ids:
+            self.api.register_state_callback(zone, self._handle_pushed_update)
+        self.api.register_batch_callback(self._handle_push_batch)
         self.api.register_connection_callback(self._handle_connection_update)
 
-        # Perform initial refresh
-        for zone in range(1, self.zones + 1):
-            await self.async_refresh_zone(zone)
-            await asyncio.sleep(0.1)
-
-        # Start periodic polling
-        self._polling_unsub = async_track_time_interval(
-            self.hass,
-            self._async_poll_all_zones,
-            timedelta(seconds=self._polling_interval),
-        )
-        _LOGGER.info(
-            "Periodic polling started (interval: %ds)", self._polling_interval
-        )
+        await self.async_config_entry_first_refresh()
 
     async def async_stop(self) -> None:
         """Stop subscriptions and polling."""
-        # Cancel polling
-        if self._polling_unsub:
-            self._polling_unsub()
-            self._polling_unsub = None
+        if self._verify_handle is not None:
+            self._verify_handle.cancel()
+            self._verify_handle = None
+        await self.async_shutdown()
 
         # Unregister callbacks
-        for zone in range(1, self.zones + 1):
+        for zone in self._zone_ids:
             self.api.unregister_state_callback(zone)
+        self.api.unregister_batch_callback(self._handle_push_batch)
         self.api.unregister_connection_callback(self._handle_connection_update)
 
-    async def _async_poll_all_zones(self, _now=None) -> None:
-        """Poll all zones for current state (called by timer)."""
+    async def _async_update_data(self) -> List[Dict[str, Any]]:
+        """Poll all zones for current state."""
         if not self._available:
             _LOGGER.debug("Skipping poll — device not available")
-            return
+            return self.data
         _LOGGER.debug("Polling all %d zones", self.zones)
-        await self.api.query_all_zones(self.zones)
-
-    async def async_refresh_zone(self, zone: int) -> None:
-        """Refresh a single zone."""
-        try:
-            state = await self.api.query_zone_status(zone)
-            if state:
-                self._zone_data[zone] = state
-                self._notify_listeners(zone)
-        except Exception as err:
-            _LOGGER.debug("Error refreshing zone %d: %s", zone, err)
+        states = await self.api.query_all_zones(self.zones)
+        if not states:
+            # A powered-down amplifier stays silent; keep the cached state
+            # and let pushed frames or the next poll fill it in
+            _LOGGER.debug("No zones responded to status queries")
+            return self.data
+        # The push path has normally merged these already, making this a no-op
+        for zone, state in states.items():
+            self._merge_zone_state(zone, state)
+        return self.data
+
+    @callback
+    def request_verify(self, zone: int) -> None:
+        """Queue a delayed verification query for a zone.
+
+        Requests made within VERIFY_DELAY of each other are batched into a
+        single pipelined query once the last of them has settled.
+        """
+        self._verify_zones.add(zone)
+        if self._verify_handle is not None:
+            self._verify_handle.cancel()
+        self._verify_handle = self.hass.loop.call_later(
+            VERIFY_DELAY, self._flush_verify
+        )
+
+    @callback
+    def _flush_verify(self) -> None:
+        """Query every zone with a pending verification request."""
+        self._verify_handle = None
+        zones = sorted(self._verify_zones)
+        self._verify_zones.clear()
+        self.hass.async_create_task(self.async_refresh_zones(zones))
+
+    async def async_refresh_zones(self, zones: Iterable[int]) -> None:
+        """Refresh the given zones."""
+        states = await self.api.query_zones(zones)
+        for zone, state in states.items():
+            self._handle_zone_update(zone, state)
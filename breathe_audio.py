@@ -1,29 +1,88 @@
 """Library/API wrapper for Breathe Audio Elevate 6.6 RS-232 serial communication."""
 
-import asyncio
 import logging
-from typing import Any, Callable, Dict, Optional, List
+from typing import Any, Callable, Dict, Iterable, Optional, List, Union
+
+from serial import SerialException
 
 try:
-    from .const import COMMAND_PREFIX, INTER_COMMAND_DELAY, MAX_ZONE, MIN_ZONE
+    from .const import (
+        COMMAND_PREFIX,
+        COMMAND_TERMINATOR,
+        MAX_BALANCE,
+        MAX_TONE,
+        MAX_VOLUME,
+        MAX_ZONE,
+        MIN_BALANCE,
+        MIN_TONE,
+        MIN_VOLUME,
+        MIN_ZONE,
+    )
     from .serial_manager import SerialConnectionManager
 except ImportError:  # pragma: no cover - standalone script fallback
-    from const import COMMAND_PREFIX, INTER_COMMAND_DELAY, MAX_ZONE, MIN_ZONE  # type: ignore[no-redef]
+    from const import (  # type: ignore[no-redef]
+        COMMAND_PREFIX,
+        COMMAND_TERMINATOR,
+        MAX_BALANCE,
+        MAX_TONE,
+        MAX_VOLUME,
+        MAX_ZONE,
+        MIN_BALANCE,
+        MIN_TONE,
+        MIN_VOLUME,
+        MIN_ZONE,
+    )
     from serial_manager import SerialConnectionManager  # type: ignore[no-redef]
 
 _LOGGER = logging.getLogger(__name__)
 
+_VALID_TONE_LEVELS = frozenset(range(MIN_TONE, MAX_TONE + 1))
+_VALID_BALANCE_LEVELS = frozenset(range(MIN_BALANCE, MAX_BALANCE + 1))
+
+
+def _zone_commands(suffix: str) -> Dict[int, bytes]:
+    """Prebuild a fixed command for every zone, encoded and terminated."""
+    return {
+        zone: f"{COMMAND_PREFIX}Z{zone:02d}{suffix}{COMMAND_TERMINATOR}".encode("ascii")
+        for zone in range(MIN_ZONE, MAX_ZONE + 1)
+    }
+
+
+# Prefix for commands that carry a variable argument, e.g. "*Z01"
+_ZONE_PREFIX = {
+    zone: f"{COMMAND_PREFIX}Z{zone:02d}" for zone in range(MIN_ZONE, MAX_ZONE + 1)
+}
+_CMD_POWER_ON = _zone_commands("on")
+_CMD_POWER_OFF = _zone_commands("off")
+_CMD_VOLUME_UP = _zone_commands("vol+")
+_CMD_VOLUME_DOWN = _zone_commands("vol-")
+_CMD_MUTE_ON = _zone_commands("mton")
+_CMD_MUTE_OFF = _zone_commands("mtoff")
+_CMD_QUERY_STATUS = _zone_commands("CONSR")
+
 
 class BreatheAudioAPI:
     """API wrapper for Breathe Audio Elevate 6.6."""
 
+    __slots__ = (
+        "_serial_port",
+        "_state_callbacks",
+        "_connection_callbacks",
+        "_batch_callbacks",
+        "_manager",
+    )
+
     def __init__(self, serial_port: str) -> None:
         """Initialize the API."""
         self._serial_port = serial_port
-        self._state_callbacks: Dict[int, Callable[[Dict[str, Any]], None]] = {}
+        self._state_callbacks: Dict[int, Callable[[int, Dict[str, Any]], None]] = {}
         self._connection_callbacks: List[Callable[[bool], None]] = []
+        self._batch_callbacks: List[Callable[[], None]] = []
         self._manager = SerialConnectionManager(
-            serial_port, self._handle_state, self._handle_connection_change
+            serial_port,
+            self._handle_state,
+            self._handle_connection_change,
+            on_state_batch=self._handle_states,
         )
 
     @property
@@ -32,9 +91,12 @@ class BreatheAudioAPI:
         return self._manager.available
 
     def register_state_callback(
-        self, zone: int, callback: Callable[[Dict[str, Any]], None]
+        self, zone: int, callback: Callable[[int, Dict[str, Any]], None]
     ) -> None:
-        """Register a callback for zone state updates."""
+        """Register a callback for zone state updates.
+
+        The callback is invoked as ``callback(zone, state)``.
+        """
         self._state_callbacks[zone] = callback
 
     def unregister_state_callback(self, zone: int) -> None:
@@ -50,6 +112,19 @@ class BreatheAudioAPI:
         if callback in self._connection_callbacks:
             self._connection_callbacks.remove(callback)
 
+    def register_batch_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked after each batch of state updates.
+
+        Zone callbacks for every state received in one serial read run first,
+        then batch callbacks run once, so listeners can coalesce their work.
+        """
+        self._batch_callbacks.append(callback)
+
+    def unregister_batch_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a batch callback."""
+        if callback in self._batch_callbacks:
+            self._batch_callbacks.remove(callback)
+
     async def connect(self) -> bool:
         """Start connection manager."""
         return await self._manager.start()
@@ -67,19 +142,26 @@ class BreatheAudioAPI:
             return
         zone = state.get("zone")
         if zone is not None and zone in self._state_callbacks:
-            self._state_callbacks[zone](state)
+            self._state_callbacks[zone](zone, state)
+
+    def _handle_states(self, states: List[Dict[str, Any]]) -> None:
+        """Process the state updates received in one serial read."""
+        for state in states:
+            self._handle_state(state)
+        for callback in list(self._batch_callbacks):
+            callback()
 
     def _handle_broadcast(self, broadcast: str) -> None:
         """Handle broadcast responses that affect all zones."""
         if broadcast == "alloff":
             for zone, cb in self._state_callbacks.items():
-                cb({"zone": zone, "power": False})
+                cb(zone, {"zone": zone, "power": False})
         elif broadcast == "extmon":
             for zone, cb in self._state_callbacks.items():
-                cb({"zone": zone, "external_mute": True})
+                cb(zone, {"zone": zone, "external_mute": True})
         elif broadcast == "extmoff":
             for zone, cb in self._state_callbacks.items():
-                cb({"zone": zone, "external_mute": False})
+                cb(zone, {"zone": zone, "external_mute": False})
 
     def _handle_connection_change(self, available: bool) -> None:
         """Notify availability listeners."""
@@ -88,89 +170,109 @@ class BreatheAudioAPI:
 
     async def _send_command(
         self,
-        command: str,
+        command: Union[str, bytes],
         zone: Optional[int] = None,
         wait_for_response: bool = False,
     ) -> Optional[Dict[str, Any]]:
-        """Send a command with optional response wait."""
-        full_command = f"{COMMAND_PREFIX}{command}"
+        """Send a full command (including prefix) with optional response wait.
+
+        Prebuilt commands are passed as terminated bytes; strings are
+        encoded and terminated by the connection manager.
+        """
         return await self._manager.send_command(
-            full_command, zone=zone, wait_for_response=wait_for_response
+            command, zone=zone, wait_for_response=wait_for_response
         )
 
+    async def _send_zone_command(self, commands: Dict[int, bytes], zone: int) -> None:
+        """Send a prebuilt per-zone command; zones outside the matrix are ignored."""
+        command = commands.get(zone)
+        if command is not None:
+            await self._send_command(command, zone=zone)
+
     # Zone control commands - Fire and Forget (No waiting)
     async def zone_power_on(self, zone: int) -> None:
         """Turn zone power on."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            await self._send_command(f"Z{zone:02d}on", zone=zone)
+        await self._send_zone_command(_CMD_POWER_ON, zone)
 
     async def zone_power_off(self, zone: int) -> None:
         """Turn zone power off."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            await self._send_command(f"Z{zone:02d}off", zone=zone)
+        await self._send_zone_command(_CMD_POWER_OFF, zone)
 
     async def set_volume(self, zone: int, volume: int) -> None:
         """Set zone volume (0-100)."""
-        if MIN_ZONE <= zone <= MAX_ZONE and 0 <= volume <= 100:
-            await self._send_command(f"Z{zone:02d}vol{volume:02d}", zone=zone)
+        prefix = _ZONE_PREFIX.get(zone)
+        if prefix is not None and MIN_VOLUME <= volume <= MAX_VOLUME:
+            await self._send_command(f"{prefix}vol{volume:02d}", zone=zone)
 
     async def volume_up(self, zone: int) -> None:
         """Increase zone volume."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            await self._send_command(f"Z{zone:02d}vol+", zone=zone)
+        await self._send_zone_command(_CMD_VOLUME_UP, zone)
 
     async def volume_down(self, zone: int) -> None:
         """Decrease zone volume."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            await self._send_command(f"Z{zone:02d}vol-", zone=zone)
+        await self._send_zone_command(_CMD_VOLUME_DOWN, zone)
 
     async def mute_on(self, zone: int) -> None:
         """Mute zone."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            await self._send_command(f"Z{zone:02d}mton", zone=zone)
+        await self._send_zone_command(_CMD_MUTE_ON, zone)
 
     async def mute_off(self, zone: int) -> None:
         """Unmute zone."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            await self._send_command(f"Z{zone:02d}mtoff", zone=zone)
+        await self._send_zone_command(_CMD_MUTE_OFF, zone)
 
     async def set_source(self, zone: int, source: int) -> None:
         """Set zone source (1-6)."""
-        if MIN_ZONE <= zone <= MAX_ZONE and 1 <= source <= 6:
-            await self._send_command(f"Z{zone:02d}src{source}", zone=zone)
+        prefix = _ZONE_PREFIX.get(zone)
+        if prefix is not None and 1 <= source <= 6:
+            await self._send_command(f"{prefix}src{source}", zone=zone)
 
     async def set_bass(self, zone: int, level: int) -> None:
         """Set zone bass level (-10 to 10)."""
-        if MIN_ZONE <= zone <= MAX_ZONE and -10 <= level <= 10:
-            sign = "+" if level >= 0 else ""
-            await self._send_command(f"Z{zone:02d}bas{sign}{level:02d}", zone=zone)
+        prefix = _ZONE_PREFIX.get(zone)
+        if prefix is not None and level in _VALID_TONE_LEVELS:
+            await self._send_command(f"{prefix}bas{level:+03d}", zone=zone)
 
     async def set_treble(self, zone: int, level: int) -> None:
         """Set zone treble level (-10 to 10)."""
-        if MIN_ZONE <= zone <= MAX_ZONE and -10 <= level <= 10:
-            sign = "+" if level >= 0 else ""
-            await self._send_command(f"Z{zone:02d}tre{sign}{level:02d}", zone=zone)
+        prefix = _ZONE_PREFIX.get(zone)
+        if prefix is not None and level in _VALID_TONE_LEVELS:
+            await self._send_command(f"{prefix}tre{level:+03d}", zone=zone)
 
     async def set_balance(self, zone: int, level: int) -> None:
         """Set zone balance (-10 to 10)."""
-        if MIN_ZONE <= zone <= MAX_ZONE and -10 <= level <= 10:
-            sign = "+" if level >= 0 else ""
-            await self._send_command(f"Z{zone:02d}bal{sign}{level:02d}", zone=zone)
+        prefix = _ZONE_PREFIX.get(zone)
+        if prefix is not None and level in _VALID_BALANCE_LEVELS:
+            await self._send_command(f"{prefix}bal{level:+03d}", zone=zone)
 
     # Query commands - These still wait (used by polling)
     async def query_zone_status(self, zone: int) -> Optional[Dict[str, Any]]:
         """Query full status of a zone."""
-        if MIN_ZONE <= zone <= MAX_ZONE:
-            return await self._send_command(
-                f"Z{zone:02d}CONSR", zone=zone, wait_for_response=True
-            )
-        return None
-
-    async def query_all_zones(self, num_zones: int) -> None:
-        """Query status of all configured zones with inter-command stagger."""
-        for zone in range(1, min(num_zones, MAX_ZONE) + 1):
-            try:
-                await self.query_zone_status(zone)
-            except Exception as err:
-                _LOGGER.debug("Error polling zone %d: %s", zone, err)
-            await asyncio.sleep(INTER_COMMAND_DELAY)
+        command = _CMD_QUERY_STATUS.get(zone)
+        if command is None:
+            return None
+        return await self._send_command(command, zone=zone, wait_for_response=True)
+
+    async def query_zones(self, zones: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Query status of the given zones.
+
+        Returns the states that were received, keyed by zone. The queries are
+        pipelined by the serial connection manager: each one is still paced
+        by the inter-command delay, but replies are collected together rather
+        than waiting out a round trip per zone.
+        """
+        commands = [
+            (zone, _CMD_QUERY_STATUS[zone])
+            for zone in zones
+            if zone in _CMD_QUERY_STATUS
+        ]
+        if not commands:
+            return {}
+        try:
+            return await self._manager.query_zones(commands)
+        except SerialException as err:
+            _LOGGER.debug("Error polling zones: %s", err)
+            return {}
+
+    async def query_all_zones(self, num_zones: int) -> Dict[int, Dict[str, Any]]:
+        """Query status of all configured zones."""
+        return await self.query_zones(range(MIN_ZONE, min(num_zones, MAX_ZONE) + 1))
@@ -1,6 +1,5 @@
 import serial
 import time
-import binascii
 import sys
 
 # Constants
@@ -37,7 +36,7 @@ try:
     # Read Wakeup Response
     pre_data = ser.read_all()
     if pre_data:
-        print(f"   [Wakeup Response] RAW: {pre_data} | HEX: {binascii.hexlify(pre_data)}")
+        print(f"   [Wakeup Response] RAW: {pre_data} | HEX: {pre_data.hex()}")
     else:
         print("   [Wakeup Response] None (Timeout)")
 
@@ -46,19 +45,22 @@ try:
     print(f"3. Sending Query: {cmd}...")
     ser.write(cmd)
     
-    # Read Response Loop
+    # Read Response Loop (each read blocks until CR or the window closes)
     print("4. Listening for 5 seconds...")
-    start_time = time.time()
+    deadline = time.monotonic() + 5
     buffer = b""
-    while time.time() - start_time < 5:
-        if ser.in_waiting:
-            chunk = ser.read(ser.in_waiting)
-            buffer += chunk
-            print(f"   [RX] {chunk} | HEX: {binascii.hexlify(chunk)}")
-            if b'\r' in buffer:
-                print("   -> Found Terminator (CR)")
-        time.sleep(0.1)
-        
+    while (remaining := deadline - time.monotonic()) > 0:
+        ser.timeout = remaining
+        frame = ser.read_until(b'\r')
+        if not frame:
+            continue
+        buffer += frame
+        print(f"   [RX] {frame} | HEX: {frame.hex()}")
+        if frame.endswith(b'\r'):
+            print("   -> Found Terminator (CR)")
+    if not buffer:
+        print("   [RX] None (Timeout)")
+
     print(f"5. Final Buffer: {buffer}")
     ser.close()
 
@@ -1,8 +1,10 @@
 """Config flow for Breathe Audio Elevate 6.6 integration."""
 
+from functools import lru_cache
 import logging
 import os
 import re
+import time
 from typing import Any, Dict, Optional
 
 import serial
@@ -18,13 +20,12 @@ from homeassistant.helpers.selector import (
     SelectSelectorMode,
 )
 
+from .breathe_audio import BreatheAudioAPI
 from .const import (
-    CONF_POLLING_INTERVAL,
     CONF_SERIAL_PORT,
     DEFAULT_SERIAL_PORT,
     CONF_ZONES,
     DEFAULT_NAME,
-    DEFAULT_POLLING_INTERVAL,
     DEFAULT_ZONES,
     DOMAIN,
     MAX_ZONE,
@@ -33,63 +34,71 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_COM_RE = re.compile(r"^COM\d+$", re.IGNORECASE)
 
-def validate_serial_port(port: str) -> bool:
-    """Validate serial port exists."""
-    try:
-        # Always allow the default hardcoded port
-        if port == DEFAULT_SERIAL_PORT:
-            return True
+# Common serial device name prefixes under /dev
+_SERIAL_PORT_PREFIXES = ("ttyUSB", "ttyACM", "tty.SLAB", "tty.wch")
+
+_ZONES_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_ZONE, max=MAX_ZONE))
+
+# Seconds a serial port scan is reused across config flow renders
+_PORT_SCAN_TTL = 10
+
+# Seconds a successful /dev existence check is reused across config flow
+# retries; only ports that exist are cached, so a newly plugged adapter is
+# picked up on the next attempt and the cache is bounded by real devices
+_PORT_EXISTS_TTL = 5
+_port_exists_cache: Dict[str, float] = {}
 
-        # On Linux/Mac, check if port exists
-        if port.startswith("/dev/"):
-            return os.path.exists(port)
-        # On Windows, basic COM port validation
-        if re.match(r"^COM\d+$", port, re.IGNORECASE):
-            return True
-        # For serial URLs (socket://, etc.)
-        if "://" in port:
-            return True
-        return False
-    except Exception:
-        return False
+
+def _validate_serial_port_shape(port: str) -> Optional[bool]:
+    """Validate a serial port name without touching the filesystem.
+
+    Returns None for /dev paths, which need an existence check.
+    """
+    # Always allow the default hardcoded port
+    if port == DEFAULT_SERIAL_PORT:
+        return True
+    # On Linux/Mac, the port must exist
+    if port.startswith("/dev/"):
+        return None
+    # On Windows, basic COM port validation
+    if _COM_RE.match(port):
+        return True
+    # For serial URLs (socket://, etc.)
+    return "://" in port
 
 
 def get_serial_port_options() -> list[str]:
     """Get list of potential serial ports."""
-    ports = []
-    
-    # Always include the default port first
-    ports.append(DEFAULT_SERIAL_PORT)
+    return list(_scan_serial_ports(int(time.monotonic() // _PORT_SCAN_TTL)))
+
+
+@lru_cache(maxsize=1)
+def _scan_serial_ports(_bucket: int) -> tuple[str, ...]:
+    """Scan for serial ports; cached per time bucket."""
+    # Always include the default port
+    ports = {DEFAULT_SERIAL_PORT}
 
     # Check for Linux /dev/serial/by-id/ paths (most reliable for USB adapters)
-    by_id_path = "/dev/serial/by-id"
-    if os.path.isdir(by_id_path):
-        try:
-            for entry in sorted(os.listdir(by_id_path)):
-                full_path = os.path.join(by_id_path, entry)
-                if full_path != DEFAULT_SERIAL_PORT:
-                    ports.append(full_path)
-        except (OSError, PermissionError):
-            pass
-    
+    try:
+        with os.scandir("/dev/serial/by-id") as entries:
+            ports.update(entry.path for entry in entries)
+    except OSError:
+        pass
+
     # Check for standard Linux/Mac serial ports
-    if os.path.isdir("/dev"):
-        try:
-            for entry in os.listdir("/dev"):
-                # Common serial port patterns
-                if entry.startswith("ttyUSB") or entry.startswith("ttyACM"):
-                    path = f"/dev/{entry}"
-                    if path != DEFAULT_SERIAL_PORT:
-                        ports.append(path)
-                elif entry.startswith("tty.SLAB") or entry.startswith("tty.wch"):
-                    path = f"/dev/{entry}"
-                    if path != DEFAULT_SERIAL_PORT:
-                        ports.append(path)
-        except (OSError, PermissionError):
-            pass
-    
-    return sorted(list(set(ports)))
+    try:
+        with os.scandir("/dev") as entries:
+            ports.update(
+                entry.path
+                for entry in entries
+                if entry.name.startswith(_SERIAL_PORT_PREFIXES)
+            )
+    except OSError:
+        pass
+
+    return tuple(sorted(ports))
 
 
 class BreatheAudioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -107,7 +116,7 @@ class BreatheAudioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             serial_port = user_input[CONF_SERIAL_PORT]
 
             # Validate serial port
-            if not validate_serial_port(serial_port):
+            if not await self._async_validate_serial_port(serial_port):
                 errors[CONF_SERIAL_PORT] = "invalid_serial_port"
             else:
                 # Check if already configured
@@ -135,8 +144,8 @@ class BreatheAudioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     _LOGGER.exception("Unexpected error: %s", err)
                     errors["base"] = "unknown"
 
-        # Get detected serial ports for the dropdown
-        port_options = get_serial_port_options()
+        # Get detected serial ports for the dropdown (scans /dev, so off-loop)
+        port_options = await self.hass.async_add_executor_job(get_serial_port_options)
         
         # Ensure default is pre-selected
         default_port = DEFAULT_SERIAL_PORT
@@ -154,12 +163,7 @@ class BreatheAudioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
                 ),
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
-                vol.Optional(CONF_ZONES, default=DEFAULT_ZONES): vol.All(
-                    vol.Coerce(int), vol.Range(min=MIN_ZONE, max=MAX_ZONE)
-                ),
-                vol.Optional(
-                    CONF_POLLING_INTERVAL, default=DEFAULT_POLLING_INTERVAL
-                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                vol.Optional(CONF_ZONES, default=DEFAULT_ZONES): _ZONES_VALIDATOR,
             }
         )
 
@@ -169,11 +173,26 @@ class BreatheAudioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def _async_validate_serial_port(self, serial_port: str) -> bool:
+        """Validate the serial port, checking /dev paths off the event loop."""
+        valid = _validate_serial_port_shape(serial_port)
+        if valid is not None:
+            return valid
+
+        now = time.monotonic()
+        checked = _port_exists_cache.get(serial_port)
+        if checked is not None and now - checked < _PORT_EXISTS_TTL:
+            return True
+        exists = await self.hass.async_add_executor_job(os.path.exists, serial_port)
+        if exists:
+            _port_exists_cache[serial_port] = now
+        else:
+            _port_exists_cache.pop(serial_port, None)
+        return exists
+
     async def _test_connection(self, serial_port: str) -> bool:
         """Test the serial connection."""
         try:
-            from .breathe_audio import BreatheAudioAPI
-
             api = BreatheAudioAPI(serial_port)
             connected = await api.connect()
             if connected:
@@ -210,18 +229,12 @@ class BreatheAudioOptionsFlowHandler(config_entries.OptionsFlow):
 
         options_schema = vol.Schema(
             {
-                vol.Optional(
-                    CONF_POLLING_INTERVAL,
-                    default=self.config_entry.options.get(
-                        CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL
-                    ),
-                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
                 vol.Optional(
                     CONF_ZONES,
                     default=self.config_entry.options.get(
                         CONF_ZONES, self.config_entry.data.get(CONF_ZONES, DEFAULT_ZONES)
                     ),
-                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_ZONE, max=MAX_ZONE)),
+                ): _ZONES_VALIDATOR,
             }
         )
 
@@ -1,5 +1,6 @@
 """Constants for the Breathe Audio Elevate 6.6 integration."""
 
+from datetime import timedelta
 from typing import Final
 
 DOMAIN: Final = "breathe_audio"
@@ -8,13 +9,18 @@ DOMAIN: Final = "breathe_audio"
 CONF_SERIAL_PORT: Final = "serial_port"
 DEFAULT_SERIAL_PORT: Final = "/dev/serial/by-id/usb-FTDI_FT232R_USB_UART_BG02QFFJ-if00-port0"
 CONF_ZONES: Final = "zones"
-CONF_POLLING_INTERVAL: Final = "polling_interval"
+
+# Device information
+MANUFACTURER: Final = "Breathe Audio"
+MODEL: Final = "Elevate 6.6 (BA-6640)"
 
 # Default values
 DEFAULT_NAME: Final = "Breathe Audio Elevate 6.6"
-DEFAULT_POLLING_INTERVAL: Final = 60  # seconds
 DEFAULT_ZONES: Final = 12
 
+# Status polling interval (push feedback covers changes between polls)
+SCAN_INTERVAL: Final = timedelta(seconds=60)
+
 # Serial connection settings
 BAUDRATE: Final = 9600
 BYTESIZE: Final = 8
@@ -59,10 +65,12 @@ SOURCES = {
     5: "Source 5",
     6: "Source 6",
 }
+SOURCE_NAMES: Final = tuple(SOURCES.values())
+SOURCE_NAME_TO_NUM: Final = {name: num for num, name in SOURCES.items()}
 
 # Volume limits
 MIN_VOLUME: Final = 0
-MAX_VOLUME: 100
+MAX_VOLUME: Final = 100
 MAX_ATTENUATION: Final = 78 # 0 to 78 (-dB)
 
 # Tone control limits
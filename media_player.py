@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from homeassistant.components.media_player import (
     MediaPlayerDeviceClass,
@@ -16,7 +16,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import BreatheAudioData
 from .breathe_audio import BreatheAudioAPI
 from .const import (
     ATTR_BALANCE,
@@ -28,13 +30,24 @@ from .const import (
     ATTR_VOLUME,
     ATTR_ZONE,
     DOMAIN,
+    MANUFACTURER,
+    MODEL,
     SOURCES,
+    SOURCE_NAME_TO_NUM,
+    SOURCE_NAMES,
     MAX_ATTENUATION,
-    VERIFY_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_SOURCE_PREFIX = "Source "
+
+# Volume level for each attenuation step: 0 (-dB) is loud (1.0), 78 is quiet (0.0)
+_VOLUME_LEVELS = tuple(
+    (MAX_ATTENUATION - volume) / MAX_ATTENUATION
+    for volume in range(MAX_ATTENUATION + 1)
+)
+
 SUPPORT_BREATHE_AUDIO = (
     MediaPlayerEntityFeature.VOLUME_SET
     | MediaPlayerEntityFeature.VOLUME_STEP
@@ -53,128 +66,109 @@ async def async_setup_entry(
     """Set up Breathe Audio media players from config entry."""
     data = hass.data[DOMAIN][config_entry.entry_id]
     api: BreatheAudioAPI = data["api"]
-    zones: int = data["zones"]
+    coordinator: BreatheAudioData = data["coordinator"]
     base_name: str = data["name"]
-    coordinator = data["coordinator"]
     serial_port = config_entry.data["serial_port"]
+    entry_id = config_entry.entry_id
 
-    entities = []
-    for zone in range(1, zones + 1):
-        entities.append(
-            BreatheAudioZone(
-                api,
-                coordinator,
-                zone,
-                base_name,
-                serial_port,
-                config_entry.entry_id,
-            )
-        )
+    async_add_entities(
+        BreatheAudioZone(api, coordinator, zone, base_name, serial_port, entry_id)
+        for zone in range(1, data["zones"] + 1)
+    )
 
-    async_add_entities(entities)
 
-
-class BreatheAudioZone(MediaPlayerEntity, RestoreEntity):
+class BreatheAudioZone(
+    CoordinatorEntity[BreatheAudioData], MediaPlayerEntity, RestoreEntity
+):
     """Representation of a Breathe Audio zone."""
 
     _attr_device_class = MediaPlayerDeviceClass.RECEIVER
     _attr_has_entity_name = True
     _attr_should_poll = False
+    _attr_source_list = SOURCE_NAMES
     _attr_supported_features = SUPPORT_BREATHE_AUDIO
 
     def __init__(
         self,
         api: BreatheAudioAPI,
-        coordinator,
+        coordinator: BreatheAudioData,
         zone: int,
         base_name: str,
         serial_port: str,
         entry_id: str,
     ) -> None:
         """Initialize the zone."""
+        super().__init__(coordinator, context=zone)
         self._api = api
-        self._coordinator = coordinator
         self._zone = zone
         self._attr_unique_id = f"{serial_port}_zone_{zone}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, serial_port)},
             name=base_name,
-            manufacturer="Breathe Audio",
-            model="Elevate 6.6 (BA-6640)",
+            manufacturer=MANUFACTURER,
+            model=MODEL,
         )
-        self._attr_source_list = list(SOURCES.values())
         self._entry_id = entry_id
 
         # State cache
         self._state: Dict[str, Any] = {}
         self._saved_volume: Optional[int] = None
+        self._written_state: Optional[Dict[str, Any]] = None
 
     @property
     def name(self) -> str:
         """Return the name of the zone."""
         return f"Zone {self._zone}"
 
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the device."""
-        power = self._state.get("power")
-        if power is True:
-            return MediaPlayerState.ON
-        return MediaPlayerState.OFF
-
     @property
     def available(self) -> bool:
         """Return True if the device is available."""
-        return self._coordinator.available
+        # CoordinatorEntity overrides Entity.available, so read the
+        # attribute explicitly; it is published by _update_attrs
+        return self._attr_available
 
-    @property
-    def volume_level(self) -> Optional[float]:
-        """Return the volume level (0.0 to 1.0)."""
-        volume = self._state.get("volume")
-        if volume is not None:
-            # Invert: 0 (-dB) is loud (1.0), 78 (-dB) is quiet (0.0)
-            level = (MAX_ATTENUATION - volume) / MAX_ATTENUATION
-            return max(0.0, min(1.0, level))
-        return None
+    @callback
+    def _update_attrs(self) -> None:
+        """Unpack the current state into entity attributes."""
+        self._attr_available = self.coordinator.available
+        state = self._state
+        self._attr_state = (
+            MediaPlayerState.ON if state.get("power") is True else MediaPlayerState.OFF
+        )
 
-    @property
-    def is_volume_muted(self) -> Optional[bool]:
-        """Return True if volume is muted."""
-        return self._state.get("mute")
+        volume = state.get("volume")
+        if volume is None:
+            self._attr_volume_level = None
+        elif 0 <= volume <= MAX_ATTENUATION:
+            self._attr_volume_level = _VOLUME_LEVELS[volume]
+        else:
+            # Out-of-range reports clamp to the nearest end of the scale
+            self._attr_volume_level = 0.0 if volume > MAX_ATTENUATION else 1.0
 
-    @property
-    def source(self) -> Optional[str]:
-        """Return the current input source."""
-        source = self._state.get("source")
-        if source is not None:
-            return SOURCES.get(source, f"Source {source}")
-        return None
+        self._attr_is_volume_muted = state.get("mute")
 
-    @property
-    def source_list(self) -> List[str]:
-        """Return the list of available input sources."""
-        return self._attr_source_list
+        source = state.get("source")
+        self._attr_source = (
+            None if source is None else SOURCES.get(source, f"Source {source}")
+        )
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
         attrs = {
             ATTR_ZONE: self._zone,
         }
 
         # Add tone controls if available
-        if "bass" in self._state:
-            attrs[ATTR_BASS] = self._state["bass"]
-        if "treble" in self._state:
-            attrs[ATTR_TREBLE] = self._state["treble"]
-        if "balance" in self._state:
-            attrs[ATTR_BALANCE] = self._state["balance"]
-        if "party_mode" in self._state:
-            attrs[ATTR_PARTY_MODE] = self._state["party_mode"]
+        if "bass" in state:
+            attrs[ATTR_BASS] = state["bass"]
+        if "treble" in state:
+            attrs[ATTR_TREBLE] = state["treble"]
+        if "balance" in state:
+            attrs[ATTR_BALANCE] = state["balance"]
+        if "party_mode" in state:
+            attrs[ATTR_PARTY_MODE] = state["party_mode"]
         if self._saved_volume is not None:
             attrs["saved_volume"] = self._saved_volume
 
-        return attrs
+        self._attr_extra_state_attributes = attrs
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -192,55 +186,61 @@ class BreatheAudioZone(MediaPlayerEntity, RestoreEntity):
                     self._saved_volume,
                 )
 
-        # Register for state updates
-        self._coordinator.register_listener(self._zone, self._handle_update)
         # Get initial state
-        self._state = self._coordinator.get_zone_state(self._zone)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        self._coordinator.unregister_listener(self._zone, self._handle_update)
-        await super().async_will_remove_from_hass()
+        self._state = self.coordinator.get_zone_state(self._zone)
+        self._update_attrs()
 
     @callback
-    def _handle_update(self) -> None:
+    def _handle_coordinator_update(self) -> None:
         """Handle state update from coordinator."""
-        self._state = self._coordinator.get_zone_state(self._zone)
+        state = self.coordinator.get_zone_state(self._zone)
+        # Listeners fire for every zone; skip the write if this one is unchanged
+        if (
+            state == self._written_state
+            and self.coordinator.available == self._attr_available
+        ):
+            return
+        self._state = state
         # Track volume while zone is on so we always have the latest
-        if self._state.get("power") and self._state.get("volume") is not None:
-            self._saved_volume = self._state["volume"]
+        if state.get("power") and state.get("volume") is not None:
+            self._saved_volume = state["volume"]
+        self._write_state()
+
+    @callback
+    def _write_state(self) -> None:
+        """Write state to Home Assistant and remember what was written."""
+        # The zone dict is shared with the coordinator, so keep a copy
+        self._written_state = dict(self._state)
+        self._update_attrs()
         self.async_write_ha_state()
 
     # Command methods - Optimistic UI Updates + post-command verification
 
     def _schedule_verify(self) -> None:
         """Schedule a delayed verification query to confirm device state."""
-        async def _verify() -> None:
-            await asyncio.sleep(VERIFY_DELAY)
-            await self._coordinator.async_refresh_zone(self._zone)
-
-        self.hass.async_create_task(_verify())
+        self.coordinator.request_verify(self._zone)
 
     async def async_turn_on(self) -> None:
         """Turn the zone on."""
-        # Optimistic update: Show ON immediately
+        # Optimistic update: Show ON (at the restored volume) immediately
+        saved_volume = self._saved_volume
         self._state["power"] = True
-        self.async_write_ha_state()
+        if saved_volume is not None:
+            self._state["volume"] = saved_volume
+        self._write_state()
 
         await self._api.zone_power_on(self._zone)
         # Restore saved volume (amp needs time to initialize after power-on)
-        if self._saved_volume is not None:
+        if saved_volume is not None:
             await asyncio.sleep(1.0)
-            await self._api.set_volume(self._zone, self._saved_volume)
-            self._state["volume"] = self._saved_volume
-            self.async_write_ha_state()
+            await self._api.set_volume(self._zone, saved_volume)
         self._schedule_verify()
 
     async def async_turn_off(self) -> None:
         """Turn the zone off."""
         # Optimistic update: Show OFF immediately
         self._state["power"] = False
-        self.async_write_ha_state()
+        self._write_state()
 
         # Save current volume before turning off
         current_vol = self._state.get("volume")
@@ -253,12 +253,13 @@ class BreatheAudioZone(MediaPlayerEntity, RestoreEntity):
         """Set volume level (0.0 to 1.0)."""
         # Invert: 1.0 -> 0 (-dB), 0.0 -> 78 (-dB)
         vol_int = int(MAX_ATTENUATION - (volume * MAX_ATTENUATION))
-        vol_int = max(0, min(MAX_ATTENUATION, vol_int))
+        if not 0 <= vol_int <= MAX_ATTENUATION:
+            vol_int = 0 if vol_int < 0 else MAX_ATTENUATION
 
         # Optimistic update + save for restore on next power-on
         self._state["volume"] = vol_int
         self._saved_volume = vol_int
-        self.async_write_ha_state()
+        self._write_state()
 
         await self._api.set_volume(self._zone, vol_int)
         self._schedule_verify()
@@ -277,7 +278,7 @@ class BreatheAudioZone(MediaPlayerEntity, RestoreEntity):
         """Mute or unmute."""
         # Optimistic update
         self._state["mute"] = mute
-        self.async_write_ha_state()
+        self._write_state()
 
         if mute:
             await self._api.mute_on(self._zone)
@@ -288,18 +289,14 @@ class BreatheAudioZone(MediaPlayerEntity, RestoreEntity):
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
         # Find source number from name
-        source_num = None
-        for num, name in SOURCES.items():
-            if name == source:
-                source_num = num
-                break
+        source_num = SOURCE_NAME_TO_NUM.get(source)
 
         if source_num is None:
             # Try to parse "Source X" format
-            if source.startswith("Source "):
+            if source.startswith(_SOURCE_PREFIX):
                 try:
-                    source_num = int(source.split()[1])
-                except (ValueError, IndexError):
+                    source_num = int(source[len(_SOURCE_PREFIX) :])
+                except ValueError:
                     pass
 
         if source_num:
@@ -322,4 +319,4 @@ class BreatheAudioZone(MediaPlayerEntity, RestoreEntity):
 
     async def async_update(self) -> None:
         """Update the entity state."""
-        await self._coordinator.async_refresh_zone(self._zone)
+        await self.coordinator.async_refresh_zones((self._zone,))
@@ -3,12 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
 import logging
 import random
-import re
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import serial
 import serial_asyncio
@@ -40,10 +38,94 @@ except ImportError:  # pragma: no cover - standalone script fallback
 
 _LOGGER = logging.getLogger(__name__)
 
+_TERMINATOR_BYTES = COMMAND_TERMINATOR.encode("ascii")
+
+# Reconnect delay doubles, with up to _RECONNECT_JITTER seconds of random
+# spread, and never exceeds _MAX_BACKOFF seconds in total
+_MAX_BACKOFF = 30.0
+_RECONNECT_JITTER = 0.25
+
+# Replies are well under 100 bytes; anything longer without a terminator is noise
+_MAX_BUFFER_SIZE = 4096
+
+
+_PARTY_MODES = ("MST", "SLV", "OFF")
+
+# Broadcast frames, with or without the response prefix
+_BROADCASTS = {
+    frame: name
+    for name in ("alloff", "extmon", "extmoff")
+    for frame in (name.upper(), f"{RESPONSE_PREFIX}{name.upper()}")
+}
+
+
+def _parse_signed_int(value: str) -> Optional[int]:
+    """Parse an optionally signed integer field; int() accepts "+"/"-" as-is."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _parse_power(part: str, state: Dict[str, Any]) -> None:
+    state["power"] = part[3:] == "ON"
+
+
+def _parse_volume(part: str, state: Dict[str, Any]) -> None:
+    vol_str = part[3:]
+    # Handle special volume values
+    if vol_str == "MT":
+        state["mute"] = True
+    elif vol_str == "XM":
+        state["external_mute"] = True
+    else:
+        volume = _parse_signed_int(vol_str)
+        if volume is not None:
+            # Handle VOL-yy format: keep the magnitude of the dB attenuation
+            state["volume"] = abs(volume)
+
+
+def _parse_mute(part: str, state: Dict[str, Any]) -> None:
+    state["mute"] = part[3:] == "ON"
+
+
+def _parse_party_mode(part: str, state: Dict[str, Any]) -> None:
+    # Party mode is a single "P" followed by MST/SLV/OFF
+    if part[1:] in _PARTY_MODES:
+        state["party_mode"] = part[1:]
+
+
+def _int_field(key: str) -> Callable[[str, Dict[str, Any]], None]:
+    """Build a parser for a signed integer field following a 3-char tag."""
+
+    def _parse(part: str, state: Dict[str, Any]) -> None:
+        value = _parse_signed_int(part[3:])
+        if value is not None:
+            state[key] = value
+
+    return _parse
+
+
+# Token parsers keyed by the first three characters of a response token
+_TOKEN_PARSERS: Dict[str, Callable[[str, Dict[str, Any]], None]] = {
+    "PWR": _parse_power,
+    "VOL": _parse_volume,
+    "MUT": _parse_mute,
+    "SRC": _int_field("source"),
+    # GRP0 = grouped, GRP1 = ungrouped (per manual)
+    "GRP": _int_field("group"),
+    "BAS": _int_field("bass"),
+    "TRE": _int_field("treble"),
+    "BAL": _int_field("balance"),
+    **{f"P{mode[:2]}": _parse_party_mode for mode in _PARTY_MODES},
+}
+
 
 class SerialMessageParser:
     """Buffering parser for chunked RS-232 ASCII frames."""
 
+    __slots__ = ("_buffer", "_terminator")
+
     def __init__(self, terminator: str = COMMAND_TERMINATOR) -> None:
         self._buffer = bytearray()
         self._terminator = terminator.encode("ascii")
@@ -51,16 +133,32 @@ class SerialMessageParser:
     def feed_data(self, data: bytes) -> List[str]:
         """Append data and return any complete frames."""
         frames: List[str] = []
-        self._buffer.extend(data)
+        buffer = self._buffer
+        terminator = self._terminator
+        term_len = len(terminator)
+        pos = 0
+        # Bytes already buffered were searched on the previous feed; only
+        # rescan enough of their tail to catch a terminator split across reads
+        search = max(len(buffer) - term_len + 1, 0)
+        # The matrix pads some replies with NULs; drop them before buffering
+        buffer.extend(data.translate(None, b"\x00"))
         while True:
-            idx = self._buffer.find(self._terminator)
+            idx = buffer.find(terminator, search)
             if idx == -1:
                 break
-            raw = bytes(self._buffer[:idx])
-            del self._buffer[: idx + len(self._terminator)]
-            text = raw.decode("ascii", errors="ignore").strip()
+            # Decode straight from the buffer slice; frames are pure ASCII
+            text = buffer[pos:idx].decode("ascii", errors="ignore").strip()
+            pos = search = idx + term_len
             if text:
                 frames.append(text)
+        # Drop consumed frames once per feed rather than once per frame
+        if pos:
+            del buffer[:pos]
+        if len(buffer) > _MAX_BUFFER_SIZE:
+            _LOGGER.warning(
+                "Discarding %d bytes of serial data without a terminator", len(buffer)
+            )
+            buffer.clear()
         return frames
 
     @staticmethod
@@ -80,14 +178,13 @@ class SerialMessageParser:
             _LOGGER.warning("Device returned error response: %s", message)
             return None
 
+        # The device answers in upper case; normalise once for the whole frame
+        text = text.upper()
+
         # Handle broadcast responses
-        upper = text.upper()
-        if upper in ("#ALLOFF", "ALLOFF"):
-            return {"broadcast": "alloff"}
-        if upper in ("#EXTMON", "EXTMON"):
-            return {"broadcast": "extmon"}
-        if upper in ("#EXTMOFF", "EXTMOFF"):
-            return {"broadcast": "extmoff"}
+        broadcast = _BROADCASTS.get(text)
+        if broadcast is not None:
+            return {"broadcast": broadcast}
 
         if text.startswith(RESPONSE_PREFIX):
             text = text[len(RESPONSE_PREFIX) :]
@@ -95,16 +192,20 @@ class SerialMessageParser:
         zone: Optional[int] = None
         rest = text
 
-        if rest.startswith("Z"):
-            match = re.match(r"Z(\d{1,2})", rest)
-            if match:
-                zone = int(match.group(1))
-                rest = rest[match.end() :]
-        elif len(rest) >= 2 and rest[:2].isdigit():
-            zone = int(rest[:2])
+        if rest[:1] == "Z":
+            # One or two zone digits follow the Z
+            if len(rest) > 1 and "0" <= rest[1] <= "9":
+                if len(rest) > 2 and "0" <= rest[2] <= "9":
+                    zone = (ord(rest[1]) - 48) * 10 + ord(rest[2]) - 48
+                    rest = rest[3:]
+                else:
+                    zone = ord(rest[1]) - 48
+                    rest = rest[2:]
+        elif len(rest) >= 2 and "0" <= rest[0] <= "9" and "0" <= rest[1] <= "9":
+            zone = (ord(rest[0]) - 48) * 10 + ord(rest[1]) - 48
             rest = rest[2:]
 
-        if zone is None and last_zone is not None and "PWR" in rest.upper():
+        if zone is None and last_zone is not None and "PWR" in rest:
             zone = last_zone
 
         tokens = [rest] if "," not in rest else rest.split(",")
@@ -113,61 +214,10 @@ class SerialMessageParser:
             state["zone"] = zone
 
         for token in tokens:
-            part = token.strip().upper()
-            if not part:
-                continue
-            if part.startswith("PWR"):
-                state["power"] = part[3:] == "ON"
-            elif part.startswith("VOL"):
-                vol_str = part[3:]
-                # Handle special volume values
-                if vol_str == "MT":
-                    state["mute"] = True
-                elif vol_str == "XM":
-                    state["external_mute"] = True
-                else:
-                    # Handle VOL-yy format (negative dB attenuation)
-                    if vol_str.startswith("-"):
-                        vol_str = vol_str[1:]
-                    elif vol_str.startswith("+"):
-                        vol_str = vol_str[1:]
-                    try:
-                        state["volume"] = int(vol_str)
-                    except ValueError:
-                        pass
-            elif part.startswith("MUT"):
-                state["mute"] = part[3:] == "ON"
-            elif part.startswith("SRC"):
-                try:
-                    state["source"] = int(part[3:])
-                except ValueError:
-                    pass
-            elif part.startswith("GRP"):
-                # GRP0 = grouped, GRP1 = ungrouped (per manual)
-                try:
-                    state["group"] = int(part[3:])
-                except ValueError:
-                    pass
-            elif part.startswith("BAS"):
-                try:
-                    state["bass"] = int(part[3:].replace("+", ""))
-                except ValueError:
-                    pass
-            elif part.startswith("TRE"):
-                try:
-                    state["treble"] = int(part[3:].replace("+", ""))
-                except ValueError:
-                    pass
-            elif part.startswith("BAL"):
-                try:
-                    state["balance"] = int(part[3:].replace("+", ""))
-                except ValueError:
-                    pass
-            elif len(part) == 1 and part == "P":
-                # Standalone "P" token — party mode field follows as next chars
-                pass
-            elif part.startswith("P") and part[1:] in ("MST", "SLV", "OFF"):
-                state["party_mode"] = part[1:]
+            part = token.strip()
+            parser = _TOKEN_PARSERS.get(part[:3])
+            if parser is not None:
+                parser(part, state)
 
         return state or None
 
@@ -175,6 +225,8 @@ class SerialMessageParser:
 class _SerialProtocol(asyncio.Protocol):
     """Asyncio protocol wrapper for serial data."""
 
+    __slots__ = ("_data_callback", "_connection_lost_callback", "_transport")
+
     def __init__(
         self,
         data_callback: Callable[[bytes], None],
@@ -204,14 +256,6 @@ class _SerialProtocol(asyncio.Protocol):
             self._transport.close()
 
 
-@dataclass
-class DeviceState:
-    """Tracks device availability and last-known zone states."""
-
-    available: bool = False
-    zones: Dict[int, Dict[str, Any]] = field(default_factory=dict)
-
-
 class SerialConnectionManager:
     """Maintain a resilient serial connection with auto-reconnect."""
 
@@ -220,10 +264,13 @@ class SerialConnectionManager:
         serial_port: str,
         on_state: Callable[[Dict[str, Any]], None],
         on_connection_change: Callable[[bool], None],
+        on_state_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
     ) -> None:
         self._serial_port = serial_port
         self._on_state = on_state
         self._on_connection_change = on_connection_change
+        # When set, states parsed from one read are delivered in a single call
+        self._on_state_batch = on_state_batch
         self._parser = SerialMessageParser()
         self._protocol: Optional[_SerialProtocol] = None
         self._transport: Optional[asyncio.Transport] = None
@@ -232,7 +279,7 @@ class SerialConnectionManager:
         self._available_event = asyncio.Event()
         self._connection_task: Optional[asyncio.Task] = None
         self._command_lock = asyncio.Lock()
-        self._response_waiter: Optional[asyncio.Future] = None
+        self._zone_waiters: Dict[Optional[int], asyncio.Future] = {}
         self._last_commanded_zone: Optional[int] = None
         self._available = False
         self._initial_connect_event = asyncio.Event()
@@ -272,64 +319,147 @@ class SerialConnectionManager:
 
     async def send_command(
         self,
-        command: str,
+        command: Union[str, bytes],
         zone: Optional[int] = None,
         wait_for_response: bool = False,
         timeout: float = COMMAND_TIMEOUT,
     ) -> Optional[Dict[str, Any]]:
-        """Send a command with optional response wait."""
-        if zone is not None:
-            self._last_commanded_zone = zone
+        """Send a command with optional response wait.
 
+        The command lock only covers pacing and the write itself; the reply
+        is awaited outside it, matched on its zone tag, so a slow or missing
+        reply does not hold up commands for other zones.
+        """
+        waiter: Optional[asyncio.Future] = None
         async with self._command_lock:
             if not self._available:
                 connected = await self._wait_for_available(timeout)
                 if not connected:
                     _LOGGER.warning("Serial not available; dropping command %s", command)
                     return None
-
-            if not self._protocol:
-                _LOGGER.warning("Serial protocol missing; dropping command %s", command)
+            if not await self._write_command(command, zone):
                 return None
+            if wait_for_response:
+                waiter = self._register_waiter(zone)
 
-            # Enforce inter-command delay per BA-6640 manual (50ms minimum)
-            now = time.monotonic()
-            elapsed = now - self._last_command_time
-            if elapsed < INTER_COMMAND_DELAY:
-                await asyncio.sleep(INTER_COMMAND_DELAY - elapsed)
+        if waiter is None:
+            return None
+        try:
+            # Shielded so a timed-out caller doesn't cancel a shared waiter
+            return await asyncio.wait_for(asyncio.shield(waiter), timeout=timeout)
+        finally:
+            if self._zone_waiters.get(zone) is waiter:
+                del self._zone_waiters[zone]
 
-            response_future: Optional[asyncio.Future] = None
-            if wait_for_response:
-                response_future = asyncio.get_running_loop().create_future()
-                self._response_waiter = response_future
+    async def query_zones(
+        self,
+        commands: Iterable[Tuple[int, Union[str, bytes]]],
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Send status queries back-to-back and collect the replies by zone.
+
+        Each query is still paced by the inter-command delay, but the next
+        one is written without waiting for the previous reply. Replies are
+        matched on their zone tag; zones that have not answered ``timeout``
+        seconds after the last write are left out of the result.
+        """
+        sent: Dict[int, asyncio.Future] = {}
+        async with self._command_lock:
+            if not self._available:
+                connected = await self._wait_for_available(timeout)
+                if not connected:
+                    _LOGGER.warning("Serial not available; skipping zone queries")
+                    return {}
+            for zone, command in commands:
+                if not await self._write_command(command, zone):
+                    _LOGGER.debug("Connection lost; abandoning zone queries")
+                    break
+                sent[zone] = self._register_waiter(zone)
 
-            payload = f"{command}{COMMAND_TERMINATOR}".encode("ascii")
-            self._protocol.write(payload)
-            self._last_command_time = time.monotonic()
+        if not sent:
+            return {}
+        try:
+            await asyncio.wait(sent.values(), timeout=timeout)
+            return {
+                zone: waiter.result()
+                for zone, waiter in sent.items()
+                if waiter.done() and not waiter.cancelled()
+            }
+        finally:
+            waiters = self._zone_waiters
+            for zone, waiter in sent.items():
+                if waiters.get(zone) is waiter:
+                    del waiters[zone]
+
+    async def _write_command(
+        self, command: Union[str, bytes], zone: Optional[int]
+    ) -> bool:
+        """Pace and write one command; the command lock must be held.
+
+        Bytes are written as-is and must already carry the terminator.
+        """
+        # Enforce inter-command delay per BA-6640 manual (50ms minimum)
+        elapsed = time.monotonic() - self._last_command_time
+        if elapsed < INTER_COMMAND_DELAY:
+            await asyncio.sleep(INTER_COMMAND_DELAY - elapsed)
+
+        if not self._available or not self._protocol:
+            _LOGGER.warning("Serial connection lost; dropping command %s", command)
+            return False
 
-            if response_future is None:
-                return None
+        if isinstance(command, str):
+            command = command.encode("ascii") + _TERMINATOR_BYTES
+        self._protocol.write(command)
+        self._last_command_time = time.monotonic()
+        if zone is not None:
+            self._last_commanded_zone = zone
+        return True
 
-            try:
-                result = await asyncio.wait_for(response_future, timeout=timeout)
-                return result  # type: ignore[return-value]
-            finally:
-                self._response_waiter = None
+    def _register_waiter(self, zone: Optional[int]) -> asyncio.Future:
+        """Return the pending reply waiter for a zone, creating it if needed."""
+        waiter = self._zone_waiters.get(zone)
+        if waiter is None or waiter.done():
+            waiter = asyncio.get_running_loop().create_future()
+            self._zone_waiters[zone] = waiter
+        return waiter
 
     def _handle_data(self, data: bytes) -> None:
         frames = self._parser.feed_data(data)
+        if not frames:
+            return
+        parse_state = self._parser.parse_state
+        on_state_batch = self._on_state_batch
+        states: List[Dict[str, Any]] = []
+        on_state = states.append if on_state_batch is not None else self._on_state
+        zone_waiters = self._zone_waiters
         for frame in frames:
-            state = self._parser.parse_state(frame, self._last_commanded_zone)
+            state = parse_state(frame)
             if not state:
                 _LOGGER.debug("Ignoring unparsed frame: %s", frame)
                 continue
             # Broadcast responses are dispatched but don't resolve per-zone waiters
             if "broadcast" in state:
-                self._on_state(state)
+                on_state(state)
                 continue
-            self._on_state(state)
-            if self._response_waiter and not self._response_waiter.done():
-                self._response_waiter.set_result(state)
+            zone = state.get("zone")
+            if zone is None:
+                # Status replies are always tagged, so an untagged frame is
+                # an ack for the zone written last. It must not answer a
+                # status query, so only a zone-less wait can take it.
+                last_zone = self._last_commanded_zone
+                if last_zone is not None and "power" in state:
+                    state["zone"] = last_zone
+                waiter = zone_waiters.pop(None, None)
+            else:
+                waiter = zone_waiters.pop(zone, None)
+                if waiter is None:
+                    # Waits registered without a zone take the next reply
+                    waiter = zone_waiters.pop(None, None)
+            on_state(state)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(state)
+        if states:
+            on_state_batch(states)
 
     def _handle_disconnect(self, _exc: Optional[Exception]) -> None:
         self._disconnect_event.set()
@@ -337,44 +467,51 @@ class SerialConnectionManager:
     async def _connection_loop(self) -> None:
         backoff = 0.5
         initial_attempt_done = False
+        # One stop waiter serves every connection cycle; only the
+        # disconnect waiter is recreated, since its event is cleared
+        stop_wait = asyncio.create_task(self._stop_event.wait())
+        disconnect_wait: Optional[asyncio.Task] = None
 
-        while not self._stop_event.is_set():
-            try:
-                await self._connect()
-                self._set_available(True)
-                if not initial_attempt_done:
-                    self._initial_connect_event.set()
-                    initial_attempt_done = True
-                backoff = 0.5
-
-                disconnect_task = asyncio.create_task(self._disconnect_event.wait())
-                stop_task = asyncio.create_task(self._stop_event.wait())
-                done, _ = await asyncio.wait(
-                    [disconnect_task, stop_task],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if stop_task in done:
-                    disconnect_task.cancel()
-                    break
-                if disconnect_task in done:
-                    stop_task.cancel()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    await self._connect()
+                    self._set_available(True)
+                    if not initial_attempt_done:
+                        self._initial_connect_event.set()
+                        initial_attempt_done = True
+                    backoff = 0.5
+
+                    disconnect_wait = asyncio.create_task(
+                        self._disconnect_event.wait()
+                    )
+                    done, _ = await asyncio.wait(
+                        [disconnect_wait, stop_wait],
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if stop_wait in done:
+                        break
                     self._disconnect_event.clear()
 
-            except Exception as err:
-                _LOGGER.error("Serial connection error: %s", err)
-                if not initial_attempt_done:
-                    self._initial_connect_event.set()
-                    initial_attempt_done = True
-            finally:
-                self._set_available(False)
-                self._cleanup_transport()
+                except Exception as err:
+                    _LOGGER.error("Serial connection error: %s", err)
+                    if not initial_attempt_done:
+                        self._initial_connect_event.set()
+                        initial_attempt_done = True
+                finally:
+                    self._set_available(False)
+                    self._cleanup_transport()
 
-            if self._stop_event.is_set():
-                break
+                if self._stop_event.is_set():
+                    break
 
-            jitter = random.uniform(0.0, 0.25)
-            await asyncio.sleep(min(backoff + jitter, 30.0))
-            backoff = min(backoff * 2, 30.0)
+                jitter = random.random() * _RECONNECT_JITTER
+                await asyncio.sleep(min(backoff + jitter, _MAX_BACKOFF))
+                backoff = min(backoff * 2, _MAX_BACKOFF)
+        finally:
+            stop_wait.cancel()
+            if disconnect_wait is not None:
+                disconnect_wait.cancel()
 
     async def _connect(self) -> None:
         loop = asyncio.get_running_loop()
@@ -1,6 +1,40 @@
 """Configure pytest to find modules correctly."""
+import importlib.util
 import sys
 import os
 
+import pytest
+import pytest_asyncio
+
 # Add the project root to sys.path so tests can import serial_manager, const, etc.
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+# The integration modules use package-relative imports, so load the project
+# root as a package under this name for tests that exercise them
+_PACKAGE = "breathe_audio_ha"
+
+
+@pytest.fixture
+def integration():
+    """Return the integration package, importing it on first use."""
+    if _PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            _PACKAGE,
+            os.path.join(_ROOT, "__init__.py"),
+            submodule_search_locations=[_ROOT],
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[_PACKAGE] = package
+        spec.loader.exec_module(package)
+    return sys.modules[_PACKAGE]
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    """Return a bare Home Assistant instance."""
+    from homeassistant.core import HomeAssistant
+
+    instance = HomeAssistant(str(tmp_path))
+    yield instance
+    await instance.async_stop(force=True)
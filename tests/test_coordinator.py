@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.exceptions import ConfigEntryNotReady
+
+
+def _fake_api(states=None) -> MagicMock:
+    api = MagicMock()
+    api.connected = True
+    api.connect = AsyncMock(return_value=True)
+    api.disconnect = AsyncMock()
+    api.query_all_zones = AsyncMock(return_value=states or {})
+    api.query_zones = AsyncMock(return_value={})
+    return api
+
+
+def _fake_entry() -> MagicMock:
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {"serial_port": "/dev/ttyUSB0", "zones": 2}
+    entry.options = {}
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_silent_amplifier_does_not_fail_first_refresh(integration, hass) -> None:
+    coordinator = integration.BreatheAudioData(hass, _fake_api(), _fake_entry(), 2)
+
+    await coordinator.async_start()
+
+    assert coordinator.available
+    assert coordinator.data == [{}, {}]
+    await coordinator.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_releases_the_connection(
+    integration, hass, monkeypatch
+) -> None:
+    api = _fake_api()
+    monkeypatch.setattr(integration, "BreatheAudioAPI", lambda _port: api)
+    monkeypatch.setattr(
+        integration.BreatheAudioData,
+        "async_start",
+        AsyncMock(side_effect=ConfigEntryNotReady("boom")),
+    )
+
+    with pytest.raises(ConfigEntryNotReady):
+        await integration.async_setup_entry(hass, _fake_entry())
+
+    api.disconnect.assert_awaited_once()
+    api.unregister_connection_callback.assert_called_once()
+    assert "entry" not in hass.data.get(integration.DOMAIN, {})
+
+
+@pytest.mark.asyncio
+async def test_availability_follows_the_connection(integration, hass) -> None:
+    api = _fake_api()
+    api.query_all_zones.side_effect = RuntimeError("poll failed")
+    coordinator = integration.BreatheAudioData(hass, api, _fake_entry(), 2)
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.available
+
+    coordinator._handle_connection_update(False)
+    assert not coordinator.available
+
+
+@pytest.mark.asyncio
+async def test_poll_notifies_listeners(integration, hass) -> None:
+    api = _fake_api({1: {"zone": 1, "power": True}})
+    coordinator = integration.BreatheAudioData(hass, api, _fake_entry(), 2)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+
+    listener.assert_called_once()
+    assert coordinator.get_zone_state(1)["power"] is True
+
+
+@pytest.mark.asyncio
+async def test_verify_requests_are_batched(integration, hass) -> None:
+    api = _fake_api()
+    coordinator = integration.BreatheAudioData(hass, api, _fake_entry(), 3)
+
+    for zone in (3, 1, 3, 2):
+        coordinator.request_verify(zone)
+    await asyncio.sleep(integration.VERIFY_DELAY + 0.1)
+    await hass.async_block_till_done()
+
+    api.query_zones.assert_awaited_once_with([1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_pending_verify(integration, hass) -> None:
+    api = _fake_api()
+    coordinator = integration.BreatheAudioData(hass, api, _fake_entry(), 2)
+
+    coordinator.request_verify(1)
+    await coordinator.async_stop()
+    await asyncio.sleep(integration.VERIFY_DELAY + 0.1)
+    await hass.async_block_till_done()
+
+    api.query_zones.assert_not_awaited()
@@ -0,0 +1,60 @@
+import importlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _zone(integration, zone: int = 3, api=None):
+    media_player = importlib.import_module(f"{integration.__name__}.media_player")
+    coordinator = MagicMock(spec=integration.BreatheAudioData)
+    return media_player.BreatheAudioZone(
+        api or MagicMock(), coordinator, zone, "Breathe Audio", "/dev/ttyUSB0", "entry"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_update_refreshes_its_zone(integration) -> None:
+    entity = _zone(integration)
+
+    await entity.async_update()
+
+    entity.coordinator.async_refresh_zones.assert_awaited_once_with((3,))
+
+
+@pytest.mark.asyncio
+async def test_select_source_parses_source_number(integration) -> None:
+    api = MagicMock()
+    api.set_source = AsyncMock()
+    entity = _zone(integration, api=api)
+
+    await entity.async_select_source("Source 7")
+    await entity.async_select_source("Source ²")
+
+    api.set_source.assert_awaited_once_with(3, 7)
+
+
+def test_coordinator_update_skips_unchanged_zone(integration) -> None:
+    entity = _zone(integration)
+    zones = [{"zone": 1}, {"zone": 2}, {"zone": 3, "power": True}]
+    entity.coordinator.get_zone_state.side_effect = lambda zone: zones[zone - 1]
+    entity.coordinator.available = True
+    entity.async_write_ha_state = MagicMock()
+
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    # Another zone changed; this one is untouched
+    zones[0]["power"] = True
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    # The shared dict changed in place; the written snapshot must notice
+    zones[2]["volume"] = 20
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+
+    # Availability alone changed
+    entity.coordinator.available = False
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 3
+    assert entity.available is False
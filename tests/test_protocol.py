@@ -2,6 +2,7 @@ import asyncio
 
 import pytest
 
+from breathe_audio import _CMD_POWER_ON, BreatheAudioAPI
 from serial_manager import SerialConnectionManager, SerialMessageParser
 
 
@@ -24,6 +25,19 @@ def test_parser_handles_chunked_frames() -> None:
     assert frames == ["#Z02PWROFF"]
 
 
+def test_parser_strips_nul_padding() -> None:
+    parser = SerialMessageParser()
+    frames = parser.feed_data(b"\x00#Z01PW\x00RON\r\x00")
+    assert frames == ["#Z01PWRON"]
+
+
+def test_parser_discards_unterminated_overflow() -> None:
+    parser = SerialMessageParser()
+    assert parser.feed_data(b"X" * 5000) == []
+    frames = parser.feed_data(b"#Z01PWRON\r")
+    assert frames == ["#Z01PWRON"]
+
+
 def test_parser_extracts_zone_and_state() -> None:
     state = SerialMessageParser.parse_state("#Z03PWRON,VOL10,MUTON")
     assert state["zone"] == 3
@@ -80,6 +94,14 @@ def test_parser_handles_error_response() -> None:
     assert state is None
 
 
+def test_parser_handles_tone_fields() -> None:
+    state = SerialMessageParser.parse_state("#Z06PWRON,BAS+05,TRE-03,BAL00")
+    assert state["zone"] == 6
+    assert state["bass"] == 5
+    assert state["treble"] == -3
+    assert state["balance"] == 0
+
+
 def test_parser_handles_party_mode_off() -> None:
     state = SerialMessageParser.parse_state("#Z03PWRON,POFF")
     assert state["party_mode"] == "OFF"
@@ -108,3 +130,121 @@ async def test_send_command_waits_for_response() -> None:
     assert manager._protocol.writes == [b"*Z01CONSR\r"]
     assert result["zone"] == 1
     assert result["power"] is True
+
+
+def test_state_batch_delivers_one_call_per_read() -> None:
+    states = []
+    batches = []
+    manager = SerialConnectionManager(
+        "TEST", states.append, lambda _available: None, on_state_batch=batches.append
+    )
+
+    manager._handle_data(b"#Z01PWRON\r#Z02PWROFF\r#ALLOFF\r")
+
+    assert states == []
+    assert len(batches) == 1
+    assert [state.get("zone") for state in batches[0]] == [1, 2, None]
+    assert batches[0][2] == {"broadcast": "alloff"}
+
+
+@pytest.mark.asyncio
+async def test_query_zones_pipelines_status_queries() -> None:
+    states = []
+    manager = SerialConnectionManager("TEST", states.append, lambda _available: None)
+    manager._protocol = _FakeProtocol()
+    manager._available = True
+    manager._available_event.set()
+
+    task = asyncio.create_task(
+        manager.query_zones([(1, "*Z01CONSR"), (2, "*Z02CONSR")], timeout=1.0)
+    )
+    while len(manager._protocol.writes) < 2:
+        await asyncio.sleep(0.01)
+    manager._handle_data(b"#Z02PWROFF\r#Z01PWRON\r")
+    result = await task
+
+    assert manager._protocol.writes == [b"*Z01CONSR\r", b"*Z02CONSR\r"]
+    assert result[1]["power"] is True
+    assert result[2]["power"] is False
+    assert manager._zone_waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_untagged_ack_during_query_goes_to_last_written_zone() -> None:
+    states = []
+    manager = SerialConnectionManager("TEST", states.append, lambda _available: None)
+    manager._protocol = _FakeProtocol()
+    manager._available = True
+    manager._available_event.set()
+
+    query = asyncio.create_task(
+        manager.query_zones([(1, "*Z01CONSR"), (2, "*Z02CONSR")], timeout=1.0)
+    )
+    while len(manager._protocol.writes) < 2:
+        await asyncio.sleep(0.01)
+    await manager.send_command("*Z05on", zone=5)
+
+    manager._handle_data(b"PWRON\r")
+    assert states == [{"zone": 5, "power": True}]
+    assert set(manager._zone_waiters) == {1, 2}
+
+    manager._handle_data(b"#Z01PWROFF\r#Z02PWROFF\r")
+    result = await query
+    assert result == {
+        1: {"zone": 1, "power": False},
+        2: {"zone": 2, "power": False},
+    }
+
+
+@pytest.mark.asyncio
+async def test_pending_reply_does_not_block_other_commands() -> None:
+    manager = SerialConnectionManager("TEST", lambda _state: None, lambda _available: None)
+    manager._protocol = _FakeProtocol()
+    manager._available = True
+    manager._available_event.set()
+
+    query = asyncio.create_task(
+        manager.send_command("*Z01CONSR", zone=1, wait_for_response=True, timeout=1.0)
+    )
+    await asyncio.sleep(0)
+    await asyncio.wait_for(manager.send_command("*Z02on", zone=2), timeout=0.5)
+    assert manager._protocol.writes == [b"*Z01CONSR\r", b"*Z02on\r"]
+
+    manager._handle_data(b"#Z02PWRON\r#Z01PWROFF\r")
+    result = await query
+    assert result["zone"] == 1
+    assert result["power"] is False
+
+
+@pytest.mark.asyncio
+async def test_tone_levels_are_sent_as_signed_two_digit_values() -> None:
+    api = BreatheAudioAPI("TEST")
+    manager = api._manager
+    manager._protocol = _FakeProtocol()
+    manager._available = True
+    manager._available_event.set()
+
+    await api.set_bass(1, -5)
+    await api.set_treble(1, 0)
+    await api.set_balance(1, 10)
+
+    assert manager._protocol.writes == [
+        b"*Z01bas-05\r",
+        b"*Z01tre+00\r",
+        b"*Z01bal+10\r",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fixed_commands_are_written_prebuilt() -> None:
+    api = BreatheAudioAPI("TEST")
+    manager = api._manager
+    manager._protocol = _FakeProtocol()
+    manager._available = True
+    manager._available_event.set()
+
+    await api.zone_power_on(2)
+    await api.set_volume(2, 30)
+
+    assert manager._protocol.writes == [b"*Z02on\r", b"*Z02vol30\r"]
+    assert manager._protocol.writes[0] is _CMD_POWER_ON[2]